@@ -113,7 +113,12 @@ class Context:
             datatype = TypeHint(datatype)
 
         if location is None:
-            location = Location(self.location.filename, None, None)
+            # NOTE(NiklasRosenstein): Location is immutable, so if the parent location does not point to a line
+            #       and column we can just reuse it.
+            if self.location.line is None and self.location.column is None:
+                location = self.location
+            else:
+                location = Location(self.location.filename, None, None)
 
         return Context(self, self.direction, value, datatype, self.settings, key, location, self.convert_func)
 
@@ -50,7 +50,7 @@ ANNOTATIONS_METADATA_KEY = "databind.core.annotations"
 
 
 def _field_has_default(field: Field) -> bool:
-    return any(x != MISSING for x in (field.default, field.default_factory))  # type: ignore
+    return any(x is not MISSING for x in (field.default, field.default_factory))  # type: ignore
 
 
 def _process_class(cls, **kwargs):
@@ -84,7 +84,7 @@ def _process_class(cls, **kwargs):
     def __post_init__(self):
         # Ensure that no field has a "uninitialized" value.
         for key in self.__dataclass_fields__.keys():
-            if getattr(self, key) == NotSet.Value:
+            if getattr(self, key) is NotSet.Value:
                 raise TypeError(f"missing required argument {key!r}")
         if orig_postinit:
             orig_postinit(self)
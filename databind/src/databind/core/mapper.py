@@ -1,14 +1,20 @@
+import functools
 import typing as t
 
 from typeapi import TypeHint
 
-from databind.core.utils import T, U
+from databind.core.utils import T, U, type_hint_cache_key
 
 if t.TYPE_CHECKING:
     from databind.core.context import Direction, Location
     from databind.core.settings import Setting, Settings, SettingsProvider
 
 
+@functools.lru_cache(maxsize=1024)
+def _get_type_hint(key: t.Hashable, datatype: t.Any) -> TypeHint:
+    return TypeHint(datatype)
+
+
 class ObjectMapper(t.Generic[T, U]):
     """The object mapper is responsible for dispatching the conversion process into a #Module.
 
@@ -21,7 +27,7 @@ class ObjectMapper(t.Generic[T, U]):
 
         assert isinstance(settings, (type(None), Settings)), settings
         self.module = Module("ObjectMapper.module")
-        self.settings = settings or Settings()
+        self.settings = settings if settings is not None else Settings()
 
     def copy(self) -> "ObjectMapper[T, U]":
         new = type(self)(self.settings.copy())
@@ -58,7 +64,13 @@ class ObjectMapper(t.Generic[T, U]):
         from databind.core.settings import Settings
 
         if not isinstance(datatype, TypeHint):
-            datatype = TypeHint(datatype)
+            # NOTE(NiklasRosenstein): Most applications pass the same few types over and over again, and building
+            #       the #TypeHint is relatively expensive. It is immutable, so we can reuse it. The cache is keyed
+            #       with #type_hint_cache_key() because e.g. `Union[int, float]` and `Union[float, int]` compare equal.
+            try:
+                datatype = _get_type_hint(type_hint_cache_key(datatype), datatype)
+            except TypeError:  # The type hint is not hashable.
+                datatype = TypeHint(datatype)
         if isinstance(settings, list):
             settings = Settings(self.settings, global_settings=settings)
 
@@ -67,9 +79,9 @@ class ObjectMapper(t.Generic[T, U]):
             direction=direction,
             value=value,
             datatype=datatype,
-            settings=settings or self.settings,
+            settings=settings if settings is not None else self.settings,
             key=Context.ROOT,
-            location=location or Location.EMPTY,
+            location=location if location is not None else Location.EMPTY,
             convert_func=self.module.convert,
         )
 
@@ -86,7 +98,8 @@ class ObjectMapper(t.Generic[T, U]):
 
         from databind.core.context import Direction, Location
 
-        return t.cast(U, self.convert(Direction.SERIALIZE, value, datatype, Location(filename, None, None), settings))
+        location = Location.EMPTY if filename is None else Location(filename, None, None)
+        return t.cast(U, self.convert(Direction.SERIALIZE, value, datatype, location, settings))
 
     def deserialize(
         self,
@@ -99,7 +112,5 @@ class ObjectMapper(t.Generic[T, U]):
 
         from databind.core.context import Direction, Location
 
-        return t.cast(
-            T,
-            self.convert(Direction.DESERIALIZE, value, datatype, Location(filename, None, None), settings),
-        )
+        location = Location.EMPTY if filename is None else Location(filename, None, None)
+        return t.cast(T, self.convert(Direction.DESERIALIZE, value, datatype, location, settings))
@@ -1,4 +1,6 @@
+import collections
 import dataclasses
+import functools
 import sys
 import typing as t
 
@@ -13,7 +15,8 @@ from typeapi import (
     type_repr,
 )
 
-from databind.core.utils import NotSet
+from databind.core.settings import Flattened, Required, get_annotation_setting
+from databind.core.utils import NotSet, type_hint_cache_key
 
 if sys.version_info[:2] <= (3, 8):
     GenericAlias = t.Any
@@ -176,20 +179,34 @@ def convert_dataclass_to_schema(dataclass_type: t.Union[type, GenericAlias, Clas
         dataclass_type
     ), f"expected a @dataclass type, but {type_repr(dataclass_type)} is not such a type"
 
+    # NOTE(NiklasRosenstein): The fields of a dataclass include all fields inherited from its bases (overridden
+    #       fields are replaced), so we only need to ask for the fields once instead of for every class in the
+    #       hierarchy.
+    dataclass_fields = dataclasses.fields(dataclass_type)
+    field_names = {field.name for field in dataclass_fields}
+
     # Figure out which field is defined on which dataclass in the class hierarchy.
     # This is important because we need to use the correct context when evaluating
     # forward references in field annotations; we can't just use the target
     # dataclass if it was defined in a different module.
     field_origin: t.Dict[str, type] = {}
-    base_queue = [hint.type]
+    base_queue: t.Deque[type] = collections.deque([dataclass_type])
+    seen_bases: t.Set[type] = set()
     while base_queue:
-        base_type = base_queue.pop(0)
+        base_type = base_queue.popleft()
+        if base_type in seen_bases:
+            # A class can appear multiple times in a hierarchy with multiple inheritance.
+            continue
+        seen_bases.add(base_type)
         if dataclasses.is_dataclass(base_type):
-            annotations = get_annotations(base_type)
-            for field in dataclasses.fields(base_type):
-                if field.name in annotations and field.name not in field_origin:
-                    field_origin[field.name] = base_type
-        base_queue += base_type.__bases__
+            for name in get_annotations(base_type):
+                if name in field_names and name not in field_origin:
+                    field_origin[name] = base_type
+        base_queue.extend(base_type.__bases__)
+
+    fields_by_origin: t.Dict[type, t.List[dataclasses.Field[t.Any]]] = {}
+    for field in dataclass_fields:
+        fields_by_origin.setdefault(field_origin[field.name], []).append(field)
 
     # Retrieve the context in which type hints from each field origin type need to be
     # evaluated.
@@ -198,41 +215,46 @@ def convert_dataclass_to_schema(dataclass_type: t.Union[type, GenericAlias, Clas
     }
 
     # Collect the members from the dataclass and its base classes.
-    queue = [hint]
+    queue: t.Deque[ClassTypeHint] = collections.deque([hint])
     fields: t.Dict[str, Field] = {}
+    visited: t.Set[type] = set()
     while queue:
-        hint = queue.pop(0)
+        hint = queue.popleft()
+        # NOTE(NiklasRosenstein): ClassTypeHint.type is a property that is not entirely free, so we only read it once.
+        hint_type = hint.type
+        if hint_type in visited:
+            # The fields of a class that we already visited through another subclass have been collected already.
+            continue
+        visited.add(hint_type)
         parameter_map = hint.get_parameter_map()
 
-        if hint.type in eval_context_by_type:
+        if hint_type in eval_context_by_type:
             # Make sure forward references are resolved.
-            hint = hint.evaluate(eval_context_by_type[hint.type])  # type: ignore[assignment]
+            hint = hint.evaluate(eval_context_by_type[hint_type])  # type: ignore[assignment]
             assert isinstance(hint, ClassTypeHint)
 
-            for field in dataclasses.fields(hint.type):
+            for field in fields_by_origin.get(hint_type, ()):
                 if not field.init:
                     # If we cannot initialize the field in the constructor, we should also
                     # exclude it from the definition of the type for de-/serializing.
                     continue
-                if field.name in fields:
-                    # Subclasses override their parent's fields.
-                    continue
-                if field_origin[field.name] != hint.type:
-                    # If this field does not belong to the current type
-                    continue
 
-                field_hint = TypeHint(field.type, field_origin[field.name]).evaluate().parameterize(parameter_map)
+                field_hint = _evaluate_field_type(field.type, field_origin[field.name])
+                if parameter_map:
+                    field_hint = field_hint.parameterize(parameter_map)
 
                 # NOTE(NiklasRosenstein): In Python 3.6, Mypy complains about "Callable does not accept self argument",
                 #       but we also cannot ignore it because of warn_unused_ignores.
                 _field_default_factory = getattr(field, "default_factory")
 
-                default = NotSet.Value if field.default == MISSING else field.default
-                default_factory = NotSet.Value if _field_default_factory == MISSING else _field_default_factory
-                has_default = default != NotSet.Value or default_factory != NotSet.Value
+                default = NotSet.Value if field.default is MISSING else field.default
+                default_factory = NotSet.Value if _field_default_factory is MISSING else _field_default_factory
+                has_default = default is not NotSet.Value or default_factory is not NotSet.Value
                 required = _is_required(field_hint, not has_default)
 
-                fields[field.name] = Field(
+                # NOTE(NiklasRosenstein): Field names are used as dictionary keys on every de-/serialization, interning
+                #       them allows lookups with names from the same source to be resolved by identity.
+                fields[sys.intern(field.name)] = Field(
                     datatype=field_hint,
                     required=required,
                     default=None if not required and not has_default else default,
@@ -245,15 +267,39 @@ def convert_dataclass_to_schema(dataclass_type: t.Union[type, GenericAlias, Clas
             pass
 
         # Continue with the base classes.
-        for base in hint.bases or hint.type.__bases__:
-            base_hint = TypeHint(base, source=hint.type).evaluate().parameterize(parameter_map)
+        for base in hint.bases or hint_type.__bases__:
+            # Most bases are not dataclasses (e.g. `object` or `Generic[T]`), we can skip those before we pay
+            # for evaluating and parameterizing the type hint.
+            if not dataclasses.is_dataclass(t.get_origin(base) or base):
+                continue
+            base_hint = TypeHint(base, source=hint_type).evaluate()
+            if parameter_map:
+                base_hint = base_hint.parameterize(parameter_map)
             assert isinstance(base_hint, ClassTypeHint), f"nani? {base_hint}"
-            if dataclasses.is_dataclass(base_hint.type):
-                queue.append(base_hint)
+            queue.append(base_hint)
 
     return Schema(fields, t.cast("Constructor", dataclass_type), dataclass_type)
 
 
+@functools.lru_cache(maxsize=1024)
+def _evaluate_field_type_cached(key: t.Hashable, type_: t.Any, source: type) -> TypeHint:
+    return TypeHint(type_, source).evaluate()
+
+
+def _evaluate_field_type(type_: t.Any, source: type) -> TypeHint:
+    """Evaluates the type of a dataclass field that was declared in the class *source*. The same field types (and
+    the same dataclasses) are converted over and over again, and evaluating forward references is expensive, so the
+    result is cached unless the type is not hashable. The cache is keyed with #type_hint_cache_key() as type hints
+    that compare equal may still differ in the order of their #typing.Union members."""
+
+    key = type_hint_cache_key(type_)
+    try:
+        hash(key)
+    except TypeError:
+        return TypeHint(type_, source).evaluate()
+    return _evaluate_field_type_cached(key, type_, source)
+
+
 def convert_typed_dict_to_schema(typed_dict: t.Union[TypedDictProtocol, t.Type[t.Any], TypeHint]) -> Schema:
     """Converts the definition of a #typing.TypedDict to a #Schema.
 
@@ -305,7 +351,7 @@ def convert_typed_dict_to_schema(typed_dict: t.Union[TypedDictProtocol, t.Type[t
 
         has_default = hasattr(typed_dict, key)
         required = _is_required(field_hint, not has_default)
-        fields[key] = Field(
+        fields[sys.intern(key)] = Field(
             datatype=field_hint,
             required=required and typed_dict.__total__,
             default=getattr(typed_dict, key) if has_default else None if not required else NotSet.Value,
@@ -318,7 +364,6 @@ def convert_typed_dict_to_schema(typed_dict: t.Union[TypedDictProtocol, t.Type[t
 def _is_required(datatype: TypeHint, default: bool) -> bool:
     """If *datatype* is a #AnnotatedTypeHint instance, it will look for a #Required settings instance and returns
     that instances #Required.enabled value. Otherwise, it returns *default*."""
-    from databind.core.settings import Required, get_annotation_setting
 
     required = get_annotation_setting(datatype, Required)
     if required:
@@ -334,8 +379,6 @@ def _is_required(datatype: TypeHint, default: bool) -> bool:
 
 
 def _is_flat(datatype: TypeHint, default: bool) -> bool:
-    from databind.core.settings import Flattened, get_annotation_setting
-
     return (get_annotation_setting(datatype, Flattened) or Flattened(default)).enabled
 
 
@@ -389,11 +432,13 @@ def get_fields_expanded(
     for field_name, field in schema.fields.items():
         if field.flattened:
             field_schema = convert_to_schema(field.datatype)
-            result[field_name] = {
-                **{k: v for k, v in field_schema.fields.items() if not v.flattened},
-                **{k: v for sf in get_fields_expanded(field_schema).values() for k, v in sf.items()},
-            }
-            for sub_field_name in result[field_name]:
-                if sub_field_name in schema.fields and sub_field_name != field_name:
-                    raise RuntimeError(f"field {sub_field_name!r} occurs multiple times")
+            expanded = {k: v for k, v in field_schema.fields.items() if not v.flattened}
+            for sub_fields in get_fields_expanded(field_schema, convert_to_schema).values():
+                expanded.update(sub_fields)
+            conflicts = expanded.keys() & schema.fields.keys()
+            conflicts.discard(field_name)
+            if conflicts:
+                sub_field_name = next(k for k in expanded if k in conflicts)
+                raise RuntimeError(f"field {sub_field_name!r} occurs multiple times")
+            result[field_name] = expanded
     return result
@@ -117,7 +117,7 @@ class Settings(SettingsProvider):
                 datatype = datatype[0]
             if isinstance(datatype, ClassTypeHint):
                 yield from get_class_settings(datatype.type, setting_type)  # type: ignore[type-var]
-                yield from self.local_settings.get(datatype.type, [])
+                yield from self.local_settings.get(datatype.type, ())
             for provider in self.providers:
                 yield from provider(context)
             yield from self.global_settings
@@ -199,7 +199,7 @@ def get_class_settings(
 ) -> t.Iterable[T_ClassDecoratorSetting]:
     """Returns all matching settings on *type_*."""
 
-    for item in vars(type_).get("__databind_settings__", []):
+    for item in vars(type_).get("__databind_settings__", ()):
         if isinstance(item, setting_type):
             yield item
 
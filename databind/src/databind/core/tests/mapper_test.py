@@ -0,0 +1,27 @@
+import typing as t
+
+import typing_extensions as te
+
+from databind.core.context import Context
+from databind.core.converter import Converter
+from databind.core.mapper import ObjectMapper
+
+
+class _RecordingConverter(Converter):
+    def __init__(self) -> None:
+        self.datatypes: t.List[t.Any] = []
+
+    def convert(self, ctx: Context) -> t.Any:
+        self.datatypes.append(ctx.datatype.hint)
+        return ctx.value
+
+
+def test_object_mapper_does_not_mix_up_type_hints_that_compare_equal() -> None:
+    converter = _RecordingConverter()
+    mapper = ObjectMapper[t.Any, t.Any]()
+    mapper.module.register(converter)
+
+    hints = [t.Union[int, float], t.Union[float, int], te.Annotated[int, 1], te.Annotated[int, True]]
+    for hint in hints * 2:
+        mapper.deserialize(1, hint)
+    assert list(map(repr, converter.datatypes)) == list(map(repr, hints * 2))
@@ -1,6 +1,7 @@
 import dataclasses
 import typing as t
 
+import pytest
 import typing_extensions as te
 from typeapi import TypeHint
 
@@ -105,6 +106,44 @@ def test_get_fields_expanded() -> None:
     }
 
 
+def test_get_fields_expanded_conflict() -> None:
+    class Dict1(te.TypedDict):
+        a: int
+        b: str
+
+    @dataclasses.dataclass
+    class Class2:
+        x: te.Annotated[Dict1, Flattened()]
+        b: int
+
+    with pytest.raises(RuntimeError) as excinfo:
+        get_fields_expanded(convert_to_schema(TypeHint(Class2)))
+    assert str(excinfo.value) == "field 'b' occurs multiple times"
+
+
+def test_get_fields_expanded_passes_convert_to_schema_to_nested_fields() -> None:
+    class Dict1(te.TypedDict):
+        a: int
+
+    class Dict2(te.TypedDict):
+        b: te.Annotated[Dict1, Flattened()]
+
+    @dataclasses.dataclass
+    class Class3:
+        c: te.Annotated[Dict2, Flattened()]
+
+    converted: t.List[TypeHint] = []
+
+    def _convert_to_schema(hint: TypeHint) -> Schema:
+        converted.append(hint)
+        return convert_to_schema(hint)
+
+    assert get_fields_expanded(convert_to_schema(TypeHint(Class3)), _convert_to_schema) == {
+        "c": {"a": Field(TypeHint(int))}
+    }
+    assert len(converted) == 2
+
+
 def test_convert_dataclass_to_schema_simple() -> None:
     @dataclasses.dataclass
     class A:
@@ -456,3 +495,68 @@ def test_parse_dataclass_with_forward_ref() -> None:
         ClassWithForwardRef,
         ClassWithForwardRef,
     )
+
+
+def test_convert_dataclass_with_default_that_does_not_support_equality_comparison() -> None:
+    class Vector:
+        def __eq__(self, other: object) -> bool:
+            raise ValueError("The truth value of a Vector is ambiguous")
+
+        __hash__ = object.__hash__
+
+    default = Vector()
+
+    @dataclasses.dataclass
+    class A:
+        a: Vector = dataclasses.field(default=default)
+        b: Vector = dataclasses.field(default_factory=Vector)
+
+    schema = convert_dataclass_to_schema(A)
+    assert schema.fields["a"].default is default
+    assert schema.fields["a"].required is False
+    assert schema.fields["b"].default_factory is Vector
+    assert schema.fields["b"].required is False
+
+
+def test_convert_dataclass_to_schema_diamond_inheritance() -> None:
+    @dataclasses.dataclass
+    class A:
+        a: int
+
+    @dataclasses.dataclass
+    class B(A):
+        b: str
+
+    @dataclasses.dataclass
+    class C(A):
+        c: float
+
+    @dataclasses.dataclass
+    class D(B, C):
+        d: bool
+
+    assert convert_dataclass_to_schema(D) == Schema(
+        {
+            "d": Field(TypeHint(bool)),
+            "b": Field(TypeHint(str)),
+            "c": Field(TypeHint(float)),
+            "a": Field(TypeHint(int)),
+        },
+        D,
+        D,
+    )
+
+
+def test_convert_dataclass_to_schema_keeps_union_member_order() -> None:
+    @dataclasses.dataclass
+    class A:
+        a: t.Union[int, float]
+        b: t.Union[float, int]
+        c: te.Annotated[int, 1]
+        d: te.Annotated[int, True]
+
+    schema = convert_dataclass_to_schema(A)
+    assert repr(schema.fields["a"].datatype.hint) == repr(t.Union[int, float])
+    assert repr(schema.fields["b"].datatype.hint) == repr(t.Union[float, int])
+    assert repr(schema.fields["c"].datatype.hint) == repr(te.Annotated[int, 1])
+    assert repr(schema.fields["d"].datatype.hint) == repr(te.Annotated[int, True])
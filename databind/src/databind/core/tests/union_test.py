@@ -0,0 +1,168 @@
+import collections
+import concurrent.futures
+import copy
+import pickle
+import threading
+import time
+import typing as t
+from unittest import mock
+
+import pytest
+
+from databind.core import union
+from databind.core.settings import Union
+from databind.core.union import ChainUnionMembers, EntrypointUnionMembers, ImportUnionMembers, StaticUnionMembers
+
+
+class _FakeEntryPoint:
+    def __init__(self, name: str, value: t.Any) -> None:
+        self.name = name
+        self.value = value
+        self.loads = 0
+
+    def load(self) -> t.Any:
+        self.loads += 1
+        return self.value
+
+
+_ENTRYPOINTS = [_FakeEntryPoint("int", int), _FakeEntryPoint("str", str)]
+
+
+@pytest.fixture
+def entrypoint_scans(monkeypatch: pytest.MonkeyPatch) -> t.Iterator[t.List[str]]:
+    scans: t.List[str] = []
+
+    def _iter_entry_points(group: str) -> t.Iterator[_FakeEntryPoint]:
+        scans.append(group)
+        return iter(_ENTRYPOINTS)
+
+    for ep in _ENTRYPOINTS:
+        ep.loads = 0
+
+    monkeypatch.setattr(union, "iter_entry_points", _iter_entry_points)
+    EntrypointUnionMembers.invalidate_cache()
+    yield scans
+    EntrypointUnionMembers.invalidate_cache()
+
+
+def test_entrypoint_union_members_scans_each_group_once(entrypoint_scans: t.List[str]) -> None:
+    assert EntrypointUnionMembers("test.group").get_type_by_id("int") is int
+    assert EntrypointUnionMembers("test.group").get_type_id(str) == "str"
+    assert EntrypointUnionMembers("test.group").get_type_ids() == ["int", "str"]
+    assert entrypoint_scans == ["test.group"]
+
+    EntrypointUnionMembers("test.other_group").get_type_ids()
+    assert entrypoint_scans == ["test.group", "test.other_group"]
+
+    EntrypointUnionMembers.invalidate_cache("test.group")
+    EntrypointUnionMembers("test.group").get_type_ids()
+    EntrypointUnionMembers("test.other_group").get_type_ids()
+    assert entrypoint_scans == ["test.group", "test.other_group", "test.group"]
+
+
+def test_entrypoint_union_members_loads_each_entrypoint_once(entrypoint_scans: t.List[str]) -> None:
+    for _ in range(3):
+        members = EntrypointUnionMembers("test.group")
+        assert members.get_type_id(int) == "int"
+        assert members.get_type_id(str) == "str"
+        assert members.get_type_by_id("int") is int
+        assert members.get_type_by_id("str") is str
+    assert [ep.loads for ep in _ENTRYPOINTS] == [1, 1]
+
+    with pytest.raises(ValueError):
+        members.get_type_id(float)
+    with pytest.raises(ValueError):
+        members.get_type_by_id("float")
+
+
+def test_static_union_members_evaluates_member_function_once_across_threads() -> None:
+    calls: t.List[None] = []
+    barrier = threading.Barrier(8)
+
+    def _member() -> t.Type[int]:
+        calls.append(None)
+        time.sleep(0.01)
+        return int
+
+    members = StaticUnionMembers({"int": _member})
+
+    def _worker() -> t.Any:
+        barrier.wait()
+        return members.get_type_by_id("int")
+
+    with concurrent.futures.ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(lambda _: _worker(), range(8)))
+
+    assert results == [int] * 8
+    assert len(calls) == 1
+
+
+def _get_int_type() -> t.Type[int]:
+    return int
+
+
+def test_static_union_members_can_be_copied_and_pickled() -> None:
+    members = StaticUnionMembers({"int": _get_int_type, "str": str})
+    assert members.get_type_by_id("int") is int
+    assert members.get_type_id(str) == "str"
+
+    for clone in (copy.copy(members), copy.deepcopy(members), pickle.loads(pickle.dumps(members))):
+        assert clone == members
+        assert clone.get_type_by_id("int") is int
+        assert clone.get_type_id(str) == "str"
+
+    union_setting = copy.deepcopy(Union({"a": int}))
+    assert union_setting.members.get_type_by_id("a") is int
+
+
+def test_chain_union_members_respects_delegate_order() -> None:
+    static = StaticUnionMembers({})
+    chain = ChainUnionMembers(static, ImportUnionMembers())
+
+    assert chain.get_type_id(collections.OrderedDict) == "collections.OrderedDict"
+    assert chain.get_type_by_id("collections.OrderedDict") is collections.OrderedDict
+
+    # A type that is added to an earlier delegate takes precedence over later delegates.
+    static.members["odict"] = collections.OrderedDict
+    static.members["collections.OrderedDict"] = dict
+    assert chain.get_type_id(collections.OrderedDict) == "odict"
+    assert chain.get_type_by_id("collections.OrderedDict") is dict
+
+    del static.members["collections.OrderedDict"]
+    assert chain.get_type_by_id("collections.OrderedDict") is collections.OrderedDict
+    chain.delegates.remove(static)
+    assert chain.get_type_id(collections.OrderedDict) == "collections.OrderedDict"
+
+
+def test_import_union_members_caches_imports() -> None:
+    members = ImportUnionMembers()
+    type_id = members.get_type_id(StaticUnionMembers)
+    assert type_id == "databind.core.union.StaticUnionMembers"
+    assert members.get_type_by_id(type_id) is StaticUnionMembers
+    with mock.patch("importlib.import_module") as import_module:
+        assert members.get_type_by_id(type_id) is StaticUnionMembers
+        assert ImportUnionMembers().get_type_by_id(type_id) is StaticUnionMembers
+    import_module.assert_not_called()
+
+
+def test_import_union_members_get_type_by_id() -> None:
+    members = ImportUnionMembers()
+    assert members.get_type_by_id("collections.OrderedDict") is collections.OrderedDict
+    assert members.get_type_by_id("databind.core.union.ImportUnionMembers") is ImportUnionMembers
+    with pytest.raises(ValueError):
+        members.get_type_by_id("databind.core.union.iter_entry_points")
+
+
+def test_union_members_have_no_instance_dict() -> None:
+    assert not hasattr(EntrypointUnionMembers("test.group"), "__dict__")
+    assert not hasattr(ImportUnionMembers(), "__dict__")
+    assert not hasattr(ChainUnionMembers(), "__dict__")
+
+
+def test_chain_union_members_get_type_ids() -> None:
+    chain = ChainUnionMembers(
+        StaticUnionMembers({"int": int, "str": str}),
+        ImportUnionMembers(),
+        StaticUnionMembers({"float": float, "int": int}),
+    )
+    assert chain.get_type_ids() == ["int", "str", "float"]
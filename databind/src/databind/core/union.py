@@ -2,19 +2,25 @@
 
 import abc
 import dataclasses
+import functools
 import importlib
+import importlib.util
 import sys
+import threading
 import types
 import typing as t
+from importlib.metadata import EntryPoint, entry_points
 
 from typeapi import ClassTypeHint, TypeHint
 
 from databind.core.utils import T
 
 if sys.version_info[:2] < (3, 10):
-    from pkg_resources import EntryPoint, iter_entry_points
+
+    def iter_entry_points(group: str) -> t.Iterator[EntryPoint]:
+        return iter(entry_points().get(group, ()))
+
 else:
-    from importlib.metadata import EntryPoint, entry_points
 
     def iter_entry_points(group: str) -> t.Iterator[EntryPoint]:
         return iter(entry_points(group=group))
@@ -27,6 +33,8 @@ class UnionMembers(abc.ABC):
     """Interface for representing the members of a union type. It defines methods to look up member type details
     based on name and Python type hints."""
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def get_type_id(self, type_: t.Any) -> str:
         """Given a Python type, return the ID of the type among the union members.
@@ -89,6 +97,18 @@ class StaticUnionMembers(UnionMembers):
 
     def __post_init__(self) -> None:
         self._eval_cache: t.Dict[str, StaticUnionMembers._TypeType] = {}
+        self._eval_lock = threading.Lock()
+
+    def __getstate__(self) -> t.Dict[str, t.Any]:
+        # NOTE (@NiklasRosenstein): Locks can't be copied or pickled, so we leave it out of the state and create a
+        #   new one in #__setstate__(). This also keeps #copy.copy() and #copy.deepcopy() working.
+        state = self.__dict__.copy()
+        del state["_eval_lock"]
+        return state
+
+    def __setstate__(self, state: t.Dict[str, t.Any]) -> None:
+        self.__dict__.update(state)
+        self._eval_lock = threading.Lock()
 
     def get_type_id(self, type_: t.Any) -> str:
         for type_id in self.members:
@@ -113,7 +133,13 @@ class StaticUnionMembers(UnionMembers):
             raise ValueError(f"{type_id!r} is not a type ID of {self}")
 
         if isinstance(member, types.FunctionType):
-            member = self._eval_cache[type_id] = member()
+            # NOTE (@NiklasRosenstein): Make sure the function is only called once even if multiple threads look up
+            #   the same member concurrently.
+            with self._eval_lock:
+                try:
+                    return self._eval_cache[type_id]
+                except KeyError:
+                    member = self._eval_cache[type_id] = member()
 
         return member
 
@@ -122,7 +148,7 @@ class StaticUnionMembers(UnionMembers):
 
     def register(self, name: t.Optional[str] = None) -> t.Callable[[t.Type[T]], t.Type[T]]:
         def _decorator(type_: t.Type[T]) -> t.Type[T]:
-            self.members[name or type_.__name__] = type_
+            self.members[sys.intern(name or type_.__name__)] = type_
             return type_
 
         return _decorator
@@ -132,28 +158,68 @@ class StaticUnionMembers(UnionMembers):
 class EntrypointUnionMembers(UnionMembers):
     """An implementation of #UnionMembers to treat the member type ID as a name for an entry in a entrypoint group."""
 
+    __slots__ = ("group",)
+
     group: str
 
-    def __post_init__(self) -> None:
-        self._entrypoints_cache: t.Optional[t.Dict[str, EntryPoint]] = None
+    #: The entrypoints of every group that has been looked up so far, shared by all instances. Scanning the installed
+    #: distributions for entrypoints is expensive and a new instance is created every time a #Union setting is
+    #: constructed, so we only want to do it once per group.
+    _entrypoints_cache: t.ClassVar[t.Dict[str, t.Dict[str, EntryPoint]]] = {}
+
+    #: The objects loaded from the entrypoints of every group, keyed by entrypoint name.
+    _loaded_cache: t.ClassVar[t.Dict[str, t.Dict[str, t.Any]]] = {}
+
+    #: The reverse mapping of #_loaded_cache for every group, filled as types are resolved by #get_type_id().
+    _type_ids_cache: t.ClassVar[t.Dict[str, t.Dict[t.Any, str]]] = {}
+
+    @classmethod
+    def invalidate_cache(cls, group: t.Optional[str] = None) -> None:
+        """Forget the cached entrypoints of the given *group*, or of all groups if no group is specified. Use this
+        if distributions that provide entrypoints were installed or removed at runtime."""
+
+        for cache in (cls._entrypoints_cache, cls._loaded_cache, cls._type_ids_cache):
+            if group is None:
+                cache.clear()
+            else:
+                cache.pop(group, None)
 
     @property
     def _entrypoints(self) -> t.Dict[str, EntryPoint]:
-        if self._entrypoints_cache is None:
-            self._entrypoints_cache = {}
-            for ep in iter_entry_points(self.group):
-                self._entrypoints_cache[ep.name] = ep
-        return self._entrypoints_cache
+        try:
+            return self._entrypoints_cache[self.group]
+        except KeyError:
+            pass
+        entrypoints = {sys.intern(ep.name): ep for ep in iter_entry_points(self.group)}
+        self._entrypoints_cache[self.group] = entrypoints
+        return entrypoints
+
+    def _load(self, name: str) -> t.Any:
+        """Load the entrypoint with the given *name*. Raises a #KeyError if there is no such entrypoint."""
+
+        loaded = self._loaded_cache.setdefault(self.group, {})
+        try:
+            return loaded[name]
+        except KeyError:
+            pass
+        value = loaded[name] = self._entrypoints[name].load()
+        return value
 
     def get_type_id(self, type_: t.Any) -> str:
-        for ep in self._entrypoints.values():
-            if ep.load() == type_:
-                return ep.name
+        type_ids = self._type_ids_cache.setdefault(self.group, {})
+        try:
+            return type_ids[type_]
+        except KeyError:
+            pass
+        for name in self._entrypoints:
+            if self._load(name) == type_:
+                type_ids[type_] = name
+                return name
         raise ValueError(f"unable to resolve type {type_!r} to a type ID for {self}")
 
     def get_type_by_id(self, type_id: str) -> t.Any:
         try:
-            return self._entrypoints[type_id].load()
+            return self._load(type_id)
         except KeyError:
             raise ValueError(f"{type_id!r} is not a valid type ID for {self}")
 
@@ -161,11 +227,46 @@ class EntrypointUnionMembers(UnionMembers):
         return list(self._entrypoints.keys())
 
 
+@functools.lru_cache(maxsize=1024)
+def _import_type(type_id: str) -> t.Any:
+    """Imports the type with the fully qualified name *type_id*. Cached because deserializing many values of an
+    #ImportUnionMembers union would otherwise repeat the same import machinery for every value."""
+
+    parts = type_id.split(".")
+    offset = 1
+    module_name = parts[0]
+    module = importlib.import_module(module_name)
+
+    # Import as many modules as we can. We check if the submodule exists before importing it instead of trying
+    # to import it and inspecting the ImportError, which is both fragile and slower.
+    for offset, part in enumerate(parts[offset:], offset):
+        if not hasattr(module, "__path__"):
+            # Not a package, so it can't have submodules.
+            break
+        sub_module_name = module_name + "." + part
+        if importlib.util.find_spec(sub_module_name) is None:
+            break
+        module = importlib.import_module(sub_module_name)
+        module_name = sub_module_name
+
+    # Read the class.
+    target = module
+    for offset, part in enumerate(parts[offset:], offset):
+        target = getattr(target, part)
+
+    if not isinstance(target, type):  # type: ignore[unreachable]
+        raise ValueError(f"{type_id!r} does not point to a type (got {type(target).__name__} instead)")
+
+    return target  # type: ignore[unreachable]
+
+
 class ImportUnionMembers(UnionMembers):
     """This #UnionMembers subclass treats type IDs as fully qualified identifiers by which to import Python classes.
 
     This implementation does not support #UnionMembers.get_type_ids()."""
 
+    __slots__ = ()
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}()"
 
@@ -178,31 +279,7 @@ class ImportUnionMembers(UnionMembers):
         return type_name
 
     def get_type_by_id(self, type_id: str) -> t.Any:
-        parts = type_id.split(".")
-        offset = 1
-        module_name = parts[0]
-        module = importlib.import_module(module_name)
-
-        # Import as many modules as we can.
-        for offset, part in enumerate(parts[offset:], offset):
-            sub_module_name = module_name + "." + part
-            try:
-                module = importlib.import_module(sub_module_name)
-                module_name = sub_module_name
-            except ImportError as exc:
-                if sub_module_name in str(exc):
-                    break
-                raise
-
-        # Read the class.
-        target = module
-        for offset, part in enumerate(parts[offset:], offset):
-            target = getattr(target, part)
-
-        if not isinstance(target, type):  # type: ignore[unreachable]
-            raise ValueError(f"{type_id!r} does not point to a type (got {type(target).__name__} instead)")
-
-        return target  # type: ignore[unreachable]
+        return _import_type(type_id)
 
     def get_type_ids(self) -> t.List[str]:
         raise NotImplementedError
@@ -212,6 +289,8 @@ class ImportUnionMembers(UnionMembers):
 class ChainUnionMembers(UnionMembers):
     """Chain multiple implementations of #UnionMembers."""
 
+    __slots__ = ("delegates",)
+
     delegates: t.List[UnionMembers]
 
     def __init__(self, *delegates: UnionMembers) -> None:
@@ -236,13 +315,10 @@ class ChainUnionMembers(UnionMembers):
         raise ValueError(f"{type_id!r} type ID is not a member of {self}\n" + "- \n".join(map(str, errors)))
 
     def get_type_ids(self) -> t.List[str]:
-        from nr.stream import Stream
-
-        def _gen() -> t.Iterator[str]:
-            for delegate in self.delegates:
-                try:
-                    yield from delegate.get_type_ids()
-                except NotImplementedError:
-                    pass
-
-        return Stream(_gen()).concat().distinct().collect()
+        type_ids: t.Dict[str, None] = {}
+        for delegate in self.delegates:
+            try:
+                type_ids.update(dict.fromkeys(delegate.get_type_ids()))
+            except NotImplementedError:
+                pass
+        return list(type_ids)
@@ -1,5 +1,5 @@
 import enum
-from typing import Any, Callable, Tuple, Type, TypeVar, Union, overload
+from typing import Any, Callable, Hashable, Tuple, Type, TypeVar, Union, overload
 
 T = TypeVar("T")
 U = TypeVar("U")
@@ -97,3 +97,21 @@ def check_subclass_of(cls: type, types: _Types, message: "_Message | None" = Non
             message = f"{cls.__name__} is not a subclass of {_repr_types(types)}"
         raise TypeError(_get_message(message))
     return cls
+
+
+def type_hint_cache_key(hint: Any) -> Hashable:
+    """
+    Returns a key for *hint* to use in caches instead of the type hint itself. Type hints that compare equal are not
+    necessarily interchangeable: a #typing.Union ignores the order of its members, and #typing.Annotated and
+    #typing.Literal compare their arguments by value (e.g. `1 == True`). Both matter for the conversion, so the key
+    retains the order and the types of the arguments. The key is only hashable if *hint* is.
+    """
+
+    key: Tuple[Any, ...] = (type(hint), hint)
+    args = getattr(hint, "__args__", None)
+    if isinstance(args, tuple):
+        key += (tuple(map(type_hint_cache_key, args)),)
+    metadata = getattr(hint, "__metadata__", None)
+    if isinstance(metadata, tuple):
+        key += (tuple((type(item), item) for item in metadata),)
+    return key
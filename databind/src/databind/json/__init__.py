@@ -1,5 +1,6 @@
 """ The #databind.json package implements the capabilities to bind JSON payloads to objects and the reverse. """
 
+import functools
 import json
 import typing as t
 
@@ -37,6 +38,14 @@ def get_object_mapper(settings: "Settings | None" = None) -> "ObjectMapper[t.Any
     return mapper
 
 
+@functools.lru_cache(maxsize=None)
+def _get_default_object_mapper() -> "ObjectMapper[t.Any, JsonType]":
+    """Returns the object mapper shared by #load() and #dump(). Settings passed to these functions are layered on
+    top of the mapper's settings for the duration of a single conversion, so the mapper itself is never modified."""
+
+    return get_object_mapper()
+
+
 @t.overload
 def load(
     value: t.Any,
@@ -63,12 +72,12 @@ def load(
     filename: "str | None" = None,
     settings: "t.List[Setting] | None" = None,
 ) -> t.Any:
-    return get_object_mapper().deserialize(value, type_, filename, settings)
+    return _get_default_object_mapper().deserialize(value, type_, filename, settings)
 
 
 @t.overload
 def loads(
-    value: str,
+    value: "str | bytes | bytearray",
     type_: "t.Type[T]",
     filename: "str | None" = None,
     settings: "t.List[Setting] | None" = None,
@@ -78,7 +87,7 @@ def loads(
 
 @t.overload
 def loads(
-    value: str,
+    value: "str | bytes | bytearray",
     type_: t.Any,
     filename: "str | None" = None,
     settings: "t.List[Setting] | None" = None,
@@ -87,11 +96,13 @@ def loads(
 
 
 def loads(
-    value: str,
+    value: "str | bytes | bytearray",
     type_: t.Any,
     filename: "str | None" = None,
     settings: "t.List[Setting] | None" = None,
 ) -> t.Any:
+    # NOTE(NiklasRosenstein): #json.loads() detects the encoding of binary input itself, so there is no need for
+    #       the caller to decode it first.
     return load(json.loads(value), type_, filename, settings)
 
 
@@ -101,7 +112,7 @@ def dump(
     filename: "str | None" = None,
     settings: "t.List[Setting] | None" = None,
 ) -> JsonType:
-    return get_object_mapper().serialize(value, type_, filename, settings)
+    return _get_default_object_mapper().serialize(value, type_, filename, settings)
 
 
 def dumps(
@@ -2,6 +2,8 @@ import base64
 import datetime
 import decimal
 import enum
+import functools
+import operator
 import typing as t
 
 from typeapi import (
@@ -35,6 +37,7 @@ from databind.core import (
     get_annotation_setting,
     get_fields_expanded,
 )
+from databind.core.utils import type_hint_cache_key
 
 T = t.TypeVar("T")
 
@@ -62,6 +65,35 @@ def _unwrap_annotated(hint: TypeHint) -> TypeHint:
     return hint
 
 
+def _collect_base_type_args(datatype: ClassTypeHint, base: type, nargs: int) -> t.Tuple[t.Tuple[t.Any, ...], ...]:
+    result: t.Dict[t.Tuple[t.Any, ...], None] = {}
+    for current in datatype.recurse_bases():
+        if issubclass(current.type, base) and len(current.args) == nargs:
+            result[current.args] = None
+    return tuple(result)
+
+
+@functools.lru_cache(maxsize=1024)
+def _collect_base_type_args_cached(
+    key: t.Hashable, hint: t.Any, base: type, nargs: int
+) -> t.Tuple[t.Tuple[t.Any, ...], ...]:
+    return _collect_base_type_args(t.cast(ClassTypeHint, TypeHint(hint)), base, nargs)
+
+
+def _get_base_type_args(datatype: ClassTypeHint, base: type, nargs: int) -> t.Tuple[t.Tuple[t.Any, ...], ...]:
+    """Returns the distinct type arguments of all classes in the hierarchy of *datatype* that are a subclass of *base*
+    and have exactly *nargs* type arguments. The result is cached if the underlying type hint is hashable, which saves
+    us from walking the type hierarchy every time a value of the same type is converted. The cache is keyed with
+    #type_hint_cache_key() so that e.g. `List[Union[int, float]]` and `List[Union[float, int]]` are kept apart."""
+
+    key = type_hint_cache_key(datatype.hint)
+    try:
+        hash(key)
+    except TypeError:
+        return _collect_base_type_args(datatype, base, nargs)
+    return _collect_base_type_args_cached(key, datatype.hint, base, nargs)
+
+
 class AnyConverter(Converter):
     """A converter for #typing.Any and #object typed values, which will return them unchanged in any case."""
 
@@ -117,7 +149,7 @@ class CollectionConverter(Converter):
 
         if isinstance(datatype, TupleTypeHint) and not datatype.repeated:
             # Require that the length of the input data matches the tuple.
-            item_types_iterator = iter(datatype)
+            item_types: "t.Iterable[TypeHint] | None" = datatype
             python_type: type = tuple
 
             def _length_check() -> None:
@@ -127,38 +159,42 @@ class CollectionConverter(Converter):
                     )
 
         else:
-            candidates = set()
-            for current in datatype.recurse_bases():
-                if issubclass(current.type, t.Collection) and len(current.args) == 1:
-                    candidates.add(current.args[0])
+            candidates = _get_base_type_args(datatype, t.Collection, 1)
             if len(candidates) == 0:
                 raise ConversionError(self, ctx, f"could not find item type in {datatype}")
             elif len(candidates) > 1:
-                raise ConversionError(self, ctx, f"found multiple item types in {datatype}: {candidates}")
+                found_item_types = {args[0] for args in candidates}
+                raise ConversionError(self, ctx, f"found multiple item types in {datatype}: {found_item_types}")
 
-            item_type = TypeHint(next(iter(candidates)))
-            item_types_iterator = iter(lambda: item_type, None)
+            item_type = TypeHint(candidates[0][0])
+            item_types = None
             python_type = datatype.type
 
             def _length_check() -> None:
                 pass
 
-        values: t.Iterable[t.Any] = (
-            ctx.spawn(val, item_type, idx).convert()
-            for idx, (val, item_type) in enumerate(zip(ctx.value, item_types_iterator))
-        )
+        def _convert_items() -> t.List[t.Any]:
+            spawn = ctx.spawn
+            if item_types is None:
+                # NOTE(NiklasRosenstein): Homogeneous collections are by far the most common case, there is no need
+                #       to zip() the items with a repeating item type for them.
+                return [spawn(val, item_type, idx).convert() for idx, val in enumerate(ctx.value)]
+            return [spawn(val, type_, idx).convert() for idx, (val, type_) in enumerate(zip(ctx.value, item_types))]
 
         if ctx.direction == Direction.SERIALIZE:
             if not isinstance(ctx.value, python_type):
                 raise ConversionError.expected(self, ctx, python_type)
             _length_check()
+            values = _convert_items()
+            if self.json_collection_type is list:
+                return values
             return self.json_collection_type(values)  # type: ignore[call-arg]
 
         else:
             if not isinstance(ctx.value, t.Collection) or isinstance(ctx.value, self._FORBIDDEN_COLLECTIONS):
                 raise ConversionError.expected(self, ctx, t.Collection)
             _length_check()
-            values = list(values)
+            values = _convert_items()
             if python_type == list:
                 return values
             elif hasattr(python_type, "_fields"):  # For collections.namedtuple
@@ -231,12 +267,13 @@ class DecimalConverter(Converter):
         if not isinstance(datatype, ClassTypeHint) or not issubclass(datatype.type, decimal.Decimal):
             raise NotImplementedError
 
-        strict = ctx.get_setting(Strict) or Strict(self.strict_by_default)
+        strict = ctx.get_setting(Strict)
+        strict_enabled = self.strict_by_default if strict is None else strict.enabled
         precision = ctx.get_setting(Precision)
         context = precision.to_decimal_context() if precision else None
 
         if ctx.direction == Direction.DESERIALIZE:
-            if (not strict.enabled and isinstance(ctx.value, (int, float))) or isinstance(ctx.value, str):
+            if (not strict_enabled and isinstance(ctx.value, (int, float))) or isinstance(ctx.value, str):
                 return decimal.Decimal(ctx.value, context)
             raise ConversionError.expected(self, ctx, str, type(ctx.value))
 
@@ -327,24 +364,23 @@ class MappingConverter(Converter):
         # Find the key and value types of the mapping.
         if not isinstance(datatype, ClassTypeHint) or not issubclass(datatype.type, t.Mapping):
             raise NotImplementedError
-        candidates = set()
-        for current in datatype.recurse_bases():
-            if issubclass(current.type, t.Mapping) and len(current.args) == 2:
-                candidates.add(current.args)
+        candidates = _get_base_type_args(datatype, t.Mapping, 2)
         if len(candidates) == 0:
             raise ConversionError(self, ctx, f"could not find key/value type in {datatype}")
         elif len(candidates) > 1:
-            raise ConversionError(self, ctx, f"found multiple key/value types in {datatype}: {candidates}")
-
-        key_type, value_type = next(iter(candidates))
+            raise ConversionError(self, ctx, f"found multiple key/value types in {datatype}: {set(candidates)}")
 
         if not isinstance(ctx.value, t.Mapping):
             raise ConversionError.expected(self, ctx, t.Mapping)
 
+        # NOTE(NiklasRosenstein): Build the #TypeHint#s once, otherwise #Context.spawn() does it for every item.
+        key_type, value_type = map(TypeHint, candidates[0])
+        spawn = ctx.spawn
+
         result = {}
         for key, value in ctx.value.items():
-            value = ctx.spawn(value, value_type, key).convert()
-            key = ctx.spawn(key, key_type, f"Key({key!r})").convert()
+            value = spawn(value, value_type, key).convert()
+            key = spawn(key, key_type, f"Key({key!r})").convert()
             result[key] = value
 
         if ctx.direction == Direction.DESERIALIZE and datatype.type != dict:
@@ -409,6 +445,13 @@ class PlainDatatypeConverter(Converter):
         }
     )
 
+    # The types that this converter can convert to.
+    _supported_types = frozenset(k[1] for k in _strict_adapters)
+
+    # Values of these types are passed through unchanged if they are already of the target type, no matter if
+    # strict conversion is enabled or not.
+    _identity_types = frozenset((str, int, float, bool))
+
     def __init__(self, strict_by_default: bool = True) -> None:
         self.strict_by_default = strict_by_default
 
@@ -416,17 +459,20 @@ class PlainDatatypeConverter(Converter):
         datatype = _unwrap_annotated(ctx.datatype)
         if not isinstance(datatype, ClassTypeHint):
             raise NotImplementedError
-        if datatype.type not in {k[0] for k in self._strict_adapters}:
+        if datatype.type not in self._supported_types:
             raise NotImplementedError
 
         source_type = type(ctx.value)
         target_type = datatype.type
-        strict = (
-            (ctx.get_setting(Strict) or Strict(self.strict_by_default))
-            if ctx.direction == Direction.DESERIALIZE
-            else Strict(True)
-        )
-        adapters = self._strict_adapters if strict.enabled else self._nonstrict_adapters
+        if source_type is target_type and source_type in self._identity_types:
+            return ctx.value
+
+        if ctx.direction == Direction.DESERIALIZE:
+            strict = ctx.get_setting(Strict)
+            strict_enabled = self.strict_by_default if strict is None else strict.enabled
+        else:
+            strict_enabled = True
+        adapters = self._strict_adapters if strict_enabled else self._nonstrict_adapters
         adapter = adapters.get((source_type, target_type))
 
         if adapter is None:
@@ -438,6 +484,17 @@ class PlainDatatypeConverter(Converter):
             raise ConversionError(self, ctx, str(exc)) from exc
 
 
+class _CachedSchema:
+    """A #Schema cached by the #SchemaConverter, along with its flattened fields expanded on first use."""
+
+    def __init__(self, schema: Schema) -> None:
+        self.schema = schema
+
+    @functools.cached_property
+    def fields_expanded(self) -> t.Dict[str, t.Dict[str, Field]]:
+        return get_fields_expanded(self.schema)
+
+
 class SchemaConverter(Converter):
     """Converter for type hints that can be adapter to a #databind.core.schema.Schema object.
 
@@ -457,21 +514,46 @@ class SchemaConverter(Converter):
         self.convert_to_schema = convert_to_schema
         self.serialize_defaults = serialize_defaults
 
+        # NOTE(NiklasRosenstein): Converting a type hint to a schema means introspecting the type and its bases all
+        #       over again, so we keep the schemas of the type hints we have already seen. The converter never
+        #       modifies a schema, so it is safe to reuse them across conversions. We also remember the type hints
+        #       that cannot be converted, as the converter is consulted for many of those, too. The expanded fields
+        #       of a schema are cached along with it, as expanding them converts the flattened fields to schemas.
+        self._try_convert_to_schema_cached = functools.lru_cache(maxsize=1024)(self._try_convert_hint_to_schema)
+
+    def _try_convert_to_schema(self, datatype: TypeHint) -> t.Union[_CachedSchema, ValueError]:
+        try:
+            return _CachedSchema(self.convert_to_schema(datatype))
+        except ValueError as exc:
+            # Don't keep the frames alive while the error is cached.
+            return exc.with_traceback(None)
+
+    def _try_convert_hint_to_schema(
+        self, key: t.Hashable, hint: t.Any, source: t.Any
+    ) -> t.Union[_CachedSchema, ValueError]:
+        return self._try_convert_to_schema(TypeHint(hint, source))
+
     @staticmethod
     def _get_alias_setting(ctx: Context, field_name: str) -> Alias:
         return ctx.get_setting(Alias) or Alias(field_name)
 
-    def _get_schema(self, ctx: Context) -> Schema:
+    def _get_schema(self, ctx: Context) -> _CachedSchema:
         deserialize_as = ctx.get_setting(DeserializeAs)
         if deserialize_as is not None:
             datatype = TypeHint(deserialize_as.type)
         else:
             datatype = _unwrap_annotated(ctx.datatype)
 
+        key = type_hint_cache_key(datatype.hint)
         try:
-            return self.convert_to_schema(datatype)
-        except ValueError as exc:
-            raise NotImplementedError(str(exc))
+            hash((key, datatype.source))
+        except TypeError:
+            schema = self._try_convert_to_schema(datatype)
+        else:
+            schema = self._try_convert_to_schema_cached(key, datatype.hint, datatype.source)
+        if isinstance(schema, ValueError):
+            raise NotImplementedError(str(schema))
+        return schema
 
     def serialize_from_schema(self, ctx: Context, schema: Schema) -> t.MutableMapping[str, t.Any]:
         try:
@@ -483,20 +565,27 @@ class SchemaConverter(Converter):
             if not is_instance:
                 raise ConversionError.expected(self, ctx, schema.type)
 
-        serialize_defaults = (ctx.get_setting(SerializeDefaults) or SerializeDefaults(self.serialize_defaults)).enabled
+        serialize_defaults_setting = ctx.get_setting(SerializeDefaults)
+        serialize_defaults = (
+            self.serialize_defaults if serialize_defaults_setting is None else serialize_defaults_setting.enabled
+        )
         result = self.json_mapping_type()
 
-        def _get_field_value(field_name: str, field: Field) -> t.Any:
-            if isinstance(ctx.value, t.Mapping):
-                return ctx.value[field_name]  # TODO (@NiklasRosenstein): Respect non-required fields
-            else:
-                return getattr(ctx.value, field_name)
+        # NOTE(NiklasRosenstein): Whether the value is a mapping does not change from field to field, so we pick
+        #       the accessor only once instead of doing the isinstance() check for every field.
+        _get_field_value: t.Callable[[t.Any, str], t.Any]
+        if isinstance(ctx.value, t.Mapping):
+            _get_field_value = operator.getitem  # TODO (@NiklasRosenstein): Respect non-required fields
+        else:
+            _get_field_value = getattr
 
         remainder_field: t.Optional[t.Tuple[str, Field]] = None
         remainder_values: t.Optional[t.Mapping[str, t.Any]] = None
+        source = ctx.value
+        spawn = ctx.spawn
 
         for field_name, field in schema.fields.items():
-            field_ctx = ctx.spawn(_get_field_value(field_name, field), field.datatype, field_name)
+            field_ctx = spawn(_get_field_value(source, field_name), field.datatype, field_name)
             remainder = field_ctx.get_setting(Remainder)
             if remainder and remainder.enabled:
                 if remainder_field is not None:
@@ -543,6 +632,11 @@ class SchemaConverter(Converter):
         return result
 
     def deserialize_from_schema(self, ctx: Context, schema: Schema) -> t.Any:
+        return self._deserialize_from_schema(ctx, schema, get_fields_expanded(schema))
+
+    def _deserialize_from_schema(
+        self, ctx: Context, schema: Schema, fields_expanded: t.Dict[str, t.Dict[str, Field]]
+    ) -> t.Any:
         if not isinstance(ctx.value, t.Mapping):
             raise ConversionError.expected(self, ctx, t.Mapping)
 
@@ -584,11 +678,10 @@ class SchemaConverter(Converter):
             return result
 
         result = {}
-        expanded = get_fields_expanded(schema)
         for field_name, field in schema.fields.items():
             if field.flattened:
-                assert field_name in expanded, field_name
-                value = ctx.spawn(_extract_fields(expanded[field_name]), field.datatype, field_name).convert()
+                assert field_name in fields_expanded, field_name
+                value = ctx.spawn(_extract_fields(fields_expanded[field_name]), field.datatype, field_name).convert()
             else:
                 container = _extract_field({}, field_name, field, False)
                 if not container:
@@ -614,11 +707,11 @@ class SchemaConverter(Converter):
         return schema.constructor(**result)
 
     def deserialize(self, ctx: Context) -> t.Any:
-        schema = self._get_schema(ctx)
-        return self.deserialize_from_schema(ctx, schema)
+        cached = self._get_schema(ctx)
+        return self._deserialize_from_schema(ctx, cached.schema, cached.fields_expanded)
 
     def serialize(self, ctx: Context) -> t.MutableMapping[str, t.Any]:
-        schema = self._get_schema(ctx)
+        schema = self._get_schema(ctx).schema
         return self.serialize_from_schema(ctx, schema)
 
 
@@ -667,6 +760,36 @@ class StringifyConverter(Converter):
             return self.formatter(ctx.value)
 
 
+def _create_plain_union_setting(datatype: UnionTypeHint) -> Union:
+    if datatype.has_none_type():
+        raise NotImplementedError("unable to handle Union type with None in it")
+    if not all(isinstance(a, ClassTypeHint) for a in datatype):
+        raise NotImplementedError(f"members of plain Union must be concrete types: {datatype}")
+    members = {t.cast(ClassTypeHint, a).type.__name__: a for a in datatype}
+    if len(members) != len(datatype):
+        raise NotImplementedError(f"members of plain Union cannot have overlapping type names: {datatype}")
+    return Union(members, Union.BEST_MATCH)
+
+
+@functools.lru_cache(maxsize=1024)
+def _create_plain_union_setting_cached(key: t.Hashable, hint: t.Any) -> Union:
+    return _create_plain_union_setting(t.cast(UnionTypeHint, TypeHint(hint)))
+
+
+def _get_plain_union_setting(datatype: UnionTypeHint) -> Union:
+    """Returns the #Union setting with the #Union.BEST_MATCH style that is used to convert a plain #typing.Union.
+    The setting is cached if the underlying type hint is hashable, which saves us from re-creating the member
+    type hints every time a value of the same union type is converted. The cache is keyed with
+    #type_hint_cache_key() because the order of the members decides which one is tried first."""
+
+    key = type_hint_cache_key(datatype.hint)
+    try:
+        hash(key)
+    except TypeError:
+        return _create_plain_union_setting(datatype)
+    return _create_plain_union_setting_cached(key, datatype.hint)
+
+
 class UnionConverter(Converter):
     """Converter for union types. The following kinds of union types are supported:
 
@@ -764,14 +887,7 @@ class UnionConverter(Converter):
         datatype = ctx.datatype
         union: t.Optional[Union]
         if isinstance(datatype, UnionTypeHint):
-            if datatype.has_none_type():
-                raise NotImplementedError("unable to handle Union type with None in it")
-            if not all(isinstance(a, ClassTypeHint) for a in datatype):
-                raise NotImplementedError(f"members of plain Union must be concrete types: {datatype}")
-            members = {t.cast(ClassTypeHint, a).type.__name__: a for a in datatype}
-            if len(members) != len(datatype):
-                raise NotImplementedError(f"members of plain Union cannot have overlapping type names: {datatype}")
-            union = Union(members, Union.BEST_MATCH)
+            union = _get_plain_union_setting(datatype)
         elif isinstance(datatype, (AnnotatedTypeHint, ClassTypeHint)):
             union = ctx.get_setting(Union)
             if union is None:
@@ -10,6 +10,7 @@ from collections import namedtuple
 import pytest
 import typing_extensions as te
 from nr.date import duration
+from typeapi import TypeHint, UnionTypeHint
 
 from databind.core.context import Context, Direction
 from databind.core.converter import ConversionError, Converter, NoMatchingConverter
@@ -328,6 +329,44 @@ def test_union_converter_best_match(direction: Direction) -> None:
         assert mapper.convert(direction, 42, t.Union[int, str]) == 42
 
 
+@pytest.mark.skipif(sys.version_info < (3, 9), reason="requires builtin generic aliases")
+def test_collection_item_union_respects_member_order() -> None:
+    import databind.json
+
+    # NOTE(NiklasRosenstein): We can't use `typing.List` here because its subscription is cached by #typing
+    #       itself, and `List[Union[float, int]]` is the same object as `List[Union[int, float]]`.
+    for _ in range(2):
+        assert type(databind.json.load([1], list[t.Union[float, int]])[0]) is float
+        assert type(databind.json.load([1], list[t.Union[int, float]])[0]) is int
+        assert type(databind.json.load({"a": 1}, dict[str, t.Union[float, int]])["a"]) is float
+        assert type(databind.json.load({"a": 1}, dict[str, t.Union[int, float]])["a"]) is int
+
+
+def test_union_converter_best_match_reuses_union_setting() -> None:
+    from databind.json.converters import _get_plain_union_setting
+
+    union = _get_plain_union_setting(t.cast(UnionTypeHint, TypeHint(t.Union[int, str])))
+    assert union.style == Union.BEST_MATCH
+    assert union.members.get_type_ids() == ["int", "str"]
+    assert _get_plain_union_setting(t.cast(UnionTypeHint, TypeHint(t.Union[int, str]))) is union
+
+    reversed_union = _get_plain_union_setting(t.cast(UnionTypeHint, TypeHint(t.Union[str, int])))
+    assert reversed_union is not union
+    assert reversed_union.members.get_type_ids() == ["str", "int"]
+
+    mapper = make_mapper([UnionConverter(), PlainDatatypeConverter()])
+    with pytest.raises(NoMatchingConverter):
+        mapper.deserialize(None, t.Union[int, str, None])
+
+
+def test_union_converter_best_match_respects_member_order() -> None:
+    import databind.json
+
+    for _ in range(2):
+        assert type(databind.json.load(1, t.Union[float, int])) is float
+        assert type(databind.json.load(1, t.Union[int, float])) is int
+
+
 @pytest.mark.parametrize("direction", (Direction.SERIALIZE, Direction.DESERIALIZE))
 def test_union_converter_keyed(direction: Direction) -> None:
     mapper = make_mapper([UnionConverter(), PlainDatatypeConverter()])
@@ -713,3 +752,72 @@ def test__JsonConverter__using_classmethods_on_plain_class() -> None:
     mapper = make_mapper([JsonConverterSupport()])
     assert mapper.serialize(MyCls(), MyCls) == "MyCls"
     assert mapper.deserialize("MyCls", MyCls) == MyCls()
+
+
+def test__dump_and_load__settings_do_not_leak_into_the_default_mapper() -> None:
+    import databind.json
+
+    @dataclasses.dataclass
+    class A:
+        a: int = 0
+
+    assert databind.json.dump(A(), A, settings=[SerializeDefaults(False)]) == {}
+    assert databind.json.dump(A(), A) == {"a": 0}
+    assert databind.json.load({}, A, settings=[SerializeDefaults(False)]) == A()
+    assert databind.json.load({"a": 1}, A) == A(1)
+
+
+def test__loads__accepts_bytes() -> None:
+    import databind.json
+
+    assert databind.json.loads(b'{"a": [1, 2]}', t.Dict[str, t.List[int]]) == {"a": [1, 2]}
+    assert databind.json.loads(bytearray(b"[1]"), t.List[int]) == [1]
+    assert databind.json.loads('{"a": [1, 2]}'.encode("utf-16"), t.Dict[str, t.List[int]]) == {"a": [1, 2]}
+
+
+def test__schema_converter__converts_each_type_to_a_schema_once() -> None:
+    from databind.core.schema import Schema, convert_to_schema
+
+    @dataclasses.dataclass
+    class A:
+        a: int
+
+    @dataclasses.dataclass
+    class B:
+        b: t.List[A]
+
+    converted: t.List[TypeHint] = []
+
+    def _convert_to_schema(hint: TypeHint) -> Schema:
+        converted.append(hint)
+        return convert_to_schema(hint)
+
+    mapper = make_mapper(
+        [SchemaConverter(convert_to_schema=_convert_to_schema), CollectionConverter(), PlainDatatypeConverter()]
+    )
+    for _ in range(3):
+        assert mapper.serialize(B([A(1), A(2)]), B) == {"b": [{"a": 1}, {"a": 2}]}
+        assert mapper.deserialize({"b": [{"a": 1}, {"a": 2}]}, B) == B([A(1), A(2)])
+    assert TypeHint(A) in converted and TypeHint(B) in converted
+    assert len(converted) == len({str(hint) for hint in converted})
+
+
+def test__schema_converter__expands_flattened_fields_once_per_schema() -> None:
+    from unittest import mock
+
+    from databind.core.schema import get_fields_expanded
+
+    @dataclasses.dataclass
+    class A:
+        a: int
+
+    @dataclasses.dataclass
+    class B:
+        x: te.Annotated[A, Flattened()]
+        b: int
+
+    mapper = make_mapper([SchemaConverter(), PlainDatatypeConverter()])
+    with mock.patch("databind.json.converters.get_fields_expanded", wraps=get_fields_expanded) as mocked:
+        for _ in range(3):
+            assert mapper.deserialize({"a": 1, "b": 2}, B) == B(A(1), 2)
+    assert mocked.call_count == 2  # Once for the schema of A and B each.